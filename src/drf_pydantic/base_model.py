@@ -36,9 +36,7 @@ class ModelMetaclass(PydanticModelMetaclass, type):
         )
         # Create serializer only if it's not already set by the user
         # Serializer should never be inherited from the parent classes
-        if not hasattr(cls, "drf_serializer") or getattr(cls, "drf_serializer") in (
-            getattr(base, "drf_serializer", None) for base in cls.__mro__[1:]
-        ):
+        if "drf_serializer" not in cls.__dict__:
             setattr(
                 cls,
                 "drf_serializer",
@@ -1,10 +1,10 @@
 import datetime
 import decimal
 import enum
-import inspect
 import typing
 import uuid
 import warnings
+import weakref
 
 import annotated_types
 import pydantic
@@ -22,7 +22,13 @@ from drf_pydantic.utils import get_union_members, is_scalar
 # Cache Serializer classes to ensure that there is a one-to-one relationship
 # between pydantic models and DRF Serializer classes
 # Example: reuse Serializer for nested models
-SERIALIZER_REGISTRY: dict[type, type[serializers.Serializer]] = {}
+# Models are weakly referenced so that the registry doesn't keep them alive
+SERIALIZER_REGISTRY: weakref.WeakKeyDictionary[
+    type, type[serializers.Serializer]
+] = weakref.WeakKeyDictionary()
+
+# types.NoneType is only available in Python 3.10+
+NoneType = type(None)
 
 # https://pydantic-docs.helpmanual.io/usage/types
 # https://www.django-rest-framework.org/api-guide/fields
@@ -34,8 +40,11 @@ FIELD_MAP: dict[type, type[serializers.Field]] = {
     str: serializers.CharField,
     pydantic.EmailStr: serializers.EmailField,
     # * Regex implemented as a special case
-    # WARN pydantic converts pydantic.HttpUrl to pydantic_core.Url
+    # WARN pydantic<2.10 converts pydantic.HttpUrl to pydantic_core.Url,
+    # keep this entry for as long as pydantic<2.10 is supported
     pydantic_core.Url: serializers.URLField,
+    # pydantic>=2.10 URL types (e.g., pydantic.HttpUrl) subclass pydantic.AnyUrl
+    pydantic.AnyUrl: serializers.URLField,
     uuid.UUID: serializers.UUIDField,
     # Numeric fields
     int: serializers.IntegerField,
@@ -115,6 +124,17 @@ def _convert_field(field: pydantic.fields.FieldInfo) -> serializers.Field:
         Django REST framework serializer Field instance.
 
     """
+    # Fast path for plain required scalar fields without metadata (e.g., name: str)
+    if (
+        not field.metadata
+        and type(field.annotation) is type
+        and field.annotation in FIELD_MAP
+        and field.is_required()
+        and field.description is None
+        and field.title is None
+    ):
+        return FIELD_MAP[field.annotation](required=True, allow_null=False)
+
     # Check if DRF field was explicitly set
     manual_drf_fields: list[serializers.Field] = []
     for item in field.metadata:
@@ -148,8 +168,11 @@ def _convert_field(field: pydantic.fields.FieldInfo) -> serializers.Field:
         drf_field_kwargs["label"] = field.title
 
     # Process constraints
+    regex_patterns: list[typing.Union[str, typing.Pattern[str]]] = []
     for item in field.metadata:
         if isinstance(item, pydantic.StringConstraints):
+            if item.pattern is not None:
+                regex_patterns.append(item.pattern)
             drf_field_kwargs["min_length"] = (
                 max(
                     drf_field_kwargs.get("min_length", float("-inf")),
@@ -236,12 +259,21 @@ def _convert_field(field: pydantic.fields.FieldInfo) -> serializers.Field:
             )
             drf_field_kwargs["max_value"] = item.lt
 
-    return _convert_type(field.annotation, field, **drf_field_kwargs)
+    if len(regex_patterns) > 1:
+        raise FieldConversionError(
+            f"Field has multiple regex patterns: {regex_patterns}"
+        )
+
+    return _convert_type(
+        field.annotation,
+        regex_patterns[0] if len(regex_patterns) == 1 else None,
+        **drf_field_kwargs,
+    )
 
 
 def _convert_type(  # noqa: PLR0911
     type_: typing.Union[typing.Type, TypeAliasType],
-    field: typing.Optional[pydantic.fields.FieldInfo] = None,
+    pattern: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
     **kwargs,
 ) -> serializers.Field:
     """
@@ -251,8 +283,8 @@ def _convert_type(  # noqa: PLR0911
     ----------
     type_ : type | TypeAliasType
         Field class.
-    field : pydantic.fields.FieldInfo | None
-        Pydantic field instance.
+    pattern : str | re.Pattern | None
+        Regex pattern constraint, converts scalar field to a RegexField.
     kwargs : dict
         Additional keyword arguments used to instantiate the serializer Field class.
 
@@ -263,19 +295,15 @@ def _convert_type(  # noqa: PLR0911
 
     """
     field_union_members = get_union_members(type_)
-    if field_union_members is not None and (
-        len(field_union_members) > 2 or type(None) not in field_union_members
-    ):
-        raise FieldConversionError(
-            f"Field has Union type which cannot be converted "
-            f"to DRF Serializer: {type_}. "
-            f"Only optional union (two types, one of which is None) is supported."
-        )
-    if field_union_members is not None and type(None) in field_union_members:
+    if field_union_members is not None:
+        if len(field_union_members) > 2 or NoneType not in field_union_members:
+            raise FieldConversionError(
+                f"Field has Union type which cannot be converted "
+                f"to DRF Serializer: {type_}. "
+                f"Only optional union (two types, one of which is None) is supported."
+            )
         kwargs["allow_null"] = True
-        type_ = [  # noqa: RUF015
-            type_ for type_ in field_union_members if type_ is not type(None)
-        ][0]
+        type_ = next(member for member in field_union_members if member is not NoneType)
     else:
         kwargs["allow_null"] = False
 
@@ -289,7 +317,7 @@ def _convert_type(  # noqa: PLR0911
 
     # Scalar field
     if is_scalar(type_):
-        if not inspect.isclass(type_):
+        if not isinstance(type_, type):
             raise FieldConversionError(  # pragma: no cover
                 f"{type_.__name__} is not a supported scalar type. "
                 f"Only classes and TypeAliasType instances are supported."
@@ -302,41 +330,30 @@ def _convert_type(  # noqa: PLR0911
                 return create_serializer_from_model(type_)(**kwargs)
         # Decimal
         elif type_ is decimal.Decimal:
-            _context = decimal.getcontext()
-            kwargs["max_digits"] = kwargs.get("max_digits", None) or _context.prec
-            kwargs["decimal_places"] = (
-                kwargs.get("decimal_places", None) or _context.prec
-            )
+            # Missing digit constraints default to the current context precision
+            if not kwargs.get("max_digits", None) or not kwargs.get(
+                "decimal_places", None
+            ):
+                _precision = decimal.getcontext().prec
+                kwargs["max_digits"] = kwargs.get("max_digits", None) or _precision
+                kwargs["decimal_places"] = (
+                    kwargs.get("decimal_places", None) or _precision
+                )
             return serializers.DecimalField(**kwargs)
         # Regex
-        elif field is not None and any(
-            isinstance(item, pydantic.StringConstraints) and item.pattern is not None
-            for item in field.metadata
-        ):
-            regex_patterns: list[str] = []
-            for item in field.metadata:
-                if (
-                    isinstance(item, pydantic.StringConstraints)
-                    and item.pattern is not None
-                ):
-                    regex_patterns.append(item.pattern)
-            if len(regex_patterns) > 1:
-                raise FieldConversionError(
-                    f"Field has multiple regex patterns: {regex_patterns}"
-                )
-            elif len(regex_patterns) == 1:
-                return serializers.RegexField(regex=item.pattern, **kwargs)
+        elif pattern is not None:
+            return serializers.RegexField(regex=pattern, **kwargs)
         # Enum
         elif issubclass(type_, enum.Enum):
+            # Tuple is returned as-is by deepcopy when DRF copies declared fields
             return serializers.ChoiceField(
-                choices=[item.value for item in type_], **kwargs
+                choices=tuple(item.value for item in type_), **kwargs
             )
-        # Known mapped scalar field
-        for key in [type, *getattr(type_, "__mro__", [])]:
-            try:
-                return FIELD_MAP[key](**kwargs)
-            except KeyError:
-                continue
+        # Known mapped scalar field, subclasses resolve to their nearest mapped base
+        for base in type_.__mro__:
+            drf_field_class = FIELD_MAP.get(base, None)
+            if drf_field_class is not None:
+                return drf_field_class(**kwargs)
         raise FieldConversionError(f"{type_.__name__} is not a supported scalar type.")
 
     # Composite field
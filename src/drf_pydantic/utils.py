@@ -7,6 +7,14 @@ try:
 except ImportError:
     UnionType = None
 
+# Classes of union type annotations, used in a single isinstance check
+UNION_TYPES = (
+    (_UnionGenericAlias,) if UnionType is None else (_UnionGenericAlias, UnionType)
+)
+
+# Classes of parametrized generic annotations (e.g., list[int], typing.List[int])
+GENERIC_ALIAS_TYPES = (GenericAlias, _GenericAlias)
+
 
 def get_union_members(
     type_: Union[UnionType, _UnionGenericAlias],
@@ -26,9 +34,7 @@ def get_union_members(
         None if type_ is not a union type.
 
     """
-    if isinstance(type_, _UnionGenericAlias) or (
-        UnionType is not None and isinstance(type_, UnionType)
-    ):
+    if isinstance(type_, UNION_TYPES):
         return type_.__args__
     return None
 
@@ -52,4 +58,7 @@ def is_scalar(type_: Type) -> bool:
         True if type is a scalar type.
 
     """
-    return not isinstance(type_, GenericAlias) and not isinstance(type_, _GenericAlias)
+    # Fast path for plain classes (e.g., int, str), which are never generic aliases
+    if type(type_) is type:
+        return True
+    return not isinstance(type_, GENERIC_ALIAS_TYPES)
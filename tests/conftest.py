@@ -1,9 +1,9 @@
 import pytest
 
-from drf_pydantic.parse import SERIALIZER_REGISTRY
+from drf_pydantic import parse
 
 
 @pytest.fixture(autouse=True, scope="function")
-def reset_serializers():
-    SERIALIZER_REGISTRY.clear()
-    assert len(SERIALIZER_REGISTRY) == 0
+def reset_serializers(monkeypatch: pytest.MonkeyPatch):
+    # Empty registry of the same type as the one declared in parse
+    monkeypatch.setattr(parse, "SERIALIZER_REGISTRY", type(parse.SERIALIZER_REGISTRY)())
@@ -14,23 +14,33 @@ from drf_pydantic.errors import ModelConversionError
 from rest_framework import serializers
 from typing_extensions import TypeAliasType
 
+PHONE_NUMBER_REGEX = re.compile(r"^\+?[0-9]+$")
 
-class TestScalar:
-    def test_bool(self):
-        class Person(BaseModel):
-            is_active: bool
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["is_active"], serializers.BooleanField)
 
-    def test_str(self):
+class TestScalar:
+    @pytest.mark.parametrize(
+        "pydantic_type, drf_type",
+        [
+            (bool, serializers.BooleanField),
+            (str, serializers.CharField),
+            (pydantic.EmailStr, serializers.EmailField),
+            (pydantic.HttpUrl, serializers.URLField),
+            (uuid.UUID, serializers.UUIDField),
+            (int, serializers.IntegerField),
+            (float, serializers.FloatField),
+            (datetime.datetime, serializers.DateTimeField),
+            (datetime.date, serializers.DateField),
+            (datetime.time, serializers.TimeField),
+            (datetime.timedelta, serializers.DurationField),
+        ],
+    )
+    def test_simple_type(self, pydantic_type, drf_type):
         class Person(BaseModel):
-            name: str
+            value: pydantic_type
 
         serializer = Person.drf_serializer()
 
-        assert isinstance(serializer.fields["name"], serializers.CharField)
+        assert isinstance(serializer.fields["value"], drf_type)
 
     def test_constrained_string(self):
         class Person(BaseModel):
@@ -64,45 +74,33 @@ class TestScalar:
         assert serializer.fields["name"].min_length == 3
         assert serializer.fields["name"].max_length == 10
 
-    def test_email(self):
-        class Person(BaseModel):
-            email: pydantic.EmailStr
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["email"], serializers.EmailField)
-
     def test_regex(self):
-        pattern = r"^\+?[0-9]+$"
-
         class Person(BaseModel):
             phone_number: typing.Annotated[
                 str,
-                pydantic.StringConstraints(pattern=pattern),
+                pydantic.StringConstraints(pattern=PHONE_NUMBER_REGEX.pattern),
             ]
 
         serializer = Person.drf_serializer()
 
         assert isinstance(serializer.fields["phone_number"], serializers.RegexField)
-        assert serializer.fields["phone_number"].validators[-1].regex == re.compile(
-            pattern
+        assert serializer.fields["phone_number"].validators[-1].regex == (
+            PHONE_NUMBER_REGEX
         )
         assert serializer.fields["phone_number"].allow_null is False
 
     def test_optional_regex(self):
-        pattern = r"^\+?[0-9]+$"
-
         class Person(BaseModel):
             phone_number: typing.Annotated[
                 typing.Optional[str],
-                pydantic.StringConstraints(pattern=pattern),
+                pydantic.StringConstraints(pattern=PHONE_NUMBER_REGEX.pattern),
             ]
 
         serializer = Person.drf_serializer()
 
         assert isinstance(serializer.fields["phone_number"], serializers.RegexField)
-        assert serializer.fields["phone_number"].validators[-1].regex == re.compile(
-            pattern
+        assert serializer.fields["phone_number"].validators[-1].regex == (
+            PHONE_NUMBER_REGEX
         )
         assert serializer.fields["phone_number"].allow_null is True
 
@@ -121,29 +119,35 @@ class TestScalar:
         assert "Error when converting model: Person" in str(exc_info.value)
         assert "Field has multiple regex patterns" in str(exc_info.value)
 
-    def test_url(self):
-        class Person(BaseModel):
-            website: pydantic.HttpUrl
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["website"], serializers.URLField)
+    def test_multiple_regex_error_on_non_scalar(self):
+        with pytest.raises(ModelConversionError) as exc_info:
 
-    def test_uuid(self):
-        class Person(BaseModel):
-            uuid: uuid.UUID
+            class Person(BaseModel):
+                phone_numbers: typing.Annotated[
+                    list[str],
+                    pydantic.StringConstraints(pattern=r"123"),
+                    pydantic.StringConstraints(pattern=r"456"),
+                ]
 
-        serializer = Person.drf_serializer()
+            Person.drf_serializer()
 
-        assert isinstance(serializer.fields["uuid"], serializers.UUIDField)
+        assert "Error when converting model: Person" in str(exc_info.value)
+        assert "Field has multiple regex patterns" in str(exc_info.value)
 
-    def test_int(self):
+    def test_regex_with_trailing_metadata(self):
         class Person(BaseModel):
-            age: int
+            phone_number: typing.Annotated[
+                str,
+                pydantic.StringConstraints(pattern=PHONE_NUMBER_REGEX.pattern),
+                pydantic.Strict(),
+            ]
 
         serializer = Person.drf_serializer()
 
-        assert isinstance(serializer.fields["age"], serializers.IntegerField)
+        assert isinstance(serializer.fields["phone_number"], serializers.RegexField)
+        assert serializer.fields["phone_number"].validators[-1].regex == (
+            PHONE_NUMBER_REGEX
+        )
 
     @pytest.mark.filterwarnings("ignore:.*is not supported by DRF.*")
     def test_int_with_constraints(self):
@@ -217,14 +221,6 @@ class TestScalar:
             exc_info4.value
         )
 
-    def test_float(self):
-        class Person(BaseModel):
-            height: float
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["height"], serializers.FloatField)
-
     @pytest.mark.filterwarnings("ignore:.*is not supported by DRF.*")
     def test_float_with_constraints(self):
         class Person(BaseModel):
@@ -297,38 +293,6 @@ class TestScalar:
         assert "Error when converting model: Person" in str(exc_info.value)
         assert "Field has multiple max_digits or decimal_places" in str(exc_info.value)
 
-    def test_datetime(self):
-        class Person(BaseModel):
-            created_at: datetime.datetime
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["created_at"], serializers.DateTimeField)
-
-    def test_date(self):
-        class Person(BaseModel):
-            birthday: datetime.date
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["birthday"], serializers.DateField)
-
-    def test_time(self):
-        class Person(BaseModel):
-            start_time: datetime.time
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["start_time"], serializers.TimeField)
-
-    def test_timedelta(self):
-        class Person(BaseModel):
-            duration: datetime.timedelta
-
-        serializer = Person.drf_serializer()
-
-        assert isinstance(serializer.fields["duration"], serializers.DurationField)
-
     def test_enum(self):
         class Gender(enum.Enum):
             MALE = 0
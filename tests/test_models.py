@@ -1,9 +1,11 @@
 import datetime
+import gc
 import typing
+import weakref
 
 import pydantic
 
-from drf_pydantic import BaseModel
+from drf_pydantic import BaseModel, base_model, parse
 from rest_framework import serializers
 
 
@@ -250,3 +252,67 @@ def test_nested_manual_serializer():
     assert isinstance(job_serializer.fields["gender"], serializers.ChoiceField)
     assert isinstance(job_serializer.fields["title"], serializers.CharField)
     assert isinstance(job_serializer.fields["peers"], serializers.ListField)
+
+
+def test_serializer_registry_does_not_keep_models_alive():
+    class Job(BaseModel):
+        title: str
+
+    assert isinstance(parse.SERIALIZER_REGISTRY, weakref.WeakKeyDictionary)
+    assert Job in parse.SERIALIZER_REGISTRY
+
+    job_ref = weakref.ref(Job)
+    del Job
+    gc.collect()
+
+    assert job_ref() is None
+
+
+def test_subclass_overriding_init_subclass_hook():
+    class Person(BaseModel):
+        name: str
+
+        @classmethod
+        def __pydantic_init_subclass__(cls, **kwargs: typing.Any) -> None:
+            super().__pydantic_init_subclass__(**kwargs)
+
+    class Employee(Person):
+        salary: float
+
+    employee_serializer = Employee.drf_serializer()
+    assert employee_serializer.__class__.__name__ == "EmployeeSerializer"
+    assert len(employee_serializer.fields) == 2
+    assert isinstance(employee_serializer.fields["name"], serializers.CharField)
+    assert isinstance(employee_serializer.fields["salary"], serializers.FloatField)
+
+
+def test_base_model_serializer():
+    serializer = BaseModel.drf_serializer()
+    assert serializer.__class__.__name__ == "BaseModelSerializer"
+    assert len(serializer.fields) == 0
+
+
+def test_subclass_overriding_init_subclass_hook_without_super():
+    class Person(BaseModel):
+        name: str
+
+        @classmethod
+        def __pydantic_init_subclass__(cls, **kwargs: typing.Any) -> None:
+            pass
+
+    class Employee(Person):
+        salary: float
+
+    employee_serializer = Employee.drf_serializer()
+    assert employee_serializer.__class__.__name__ == "EmployeeSerializer"
+    assert len(employee_serializer.fields) == 2
+
+
+def test_model_metaclass():
+    class Person(pydantic.BaseModel, metaclass=base_model.ModelMetaclass):
+        name: str
+
+    serializer = Person.drf_serializer()
+    assert serializer.__class__.__name__ == "PersonSerializer"
+    assert len(serializer.fields) == 1
+    assert isinstance(serializer.fields["name"], serializers.CharField)